@@ -1,45 +1,203 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import os
-import re
+import random
+import time
+from dataclasses import dataclass
 from datetime import datetime
 
 from telethon import TelegramClient, events
 from telethon.errors import RPCError
-
-from app.db.repo import Repo
+from telethon.tl.types import (
+    Channel,
+    Chat,
+    InputPeerChannel,
+    InputPeerChat,
+    InputPeerUser,
+    User,
+)
+
+from app.db.repo import BotState, Repo
+
+# Built once: yo-fold table used by the title/text normalization hot paths.
+_YO_FOLD = str.maketrans({"ё": "е", "Ё": "е"})
+
+
+@dataclass(frozen=True)
+class TelethonConfig:
+    """Process-lifetime Telethon settings, read and validated from env once."""
+
+    api_id: int
+    api_hash: str
+    session_path: str
+    target_default: str
+
+    @classmethod
+    def from_env(cls) -> TelethonConfig:
+        api_id_raw = os.environ.get("TELEGRAM_API_ID", "").strip()
+        session_dir = os.environ.get("TELEGRAM_SESSION_DIR", "/app/session").strip()
+        session_filename = os.environ.get("TELEGRAM_SESSION_FILE", "monitor.session").strip()
+        return cls(
+            # isdecimal gate: only clean ASCII digits reach int(), and junk
+            # values degrade to the explicit missing-config error instead of
+            # a raw ValueError.
+            api_id=int(api_id_raw) if api_id_raw.isdecimal() else 0,
+            api_hash=os.environ.get("TELEGRAM_API_HASH", "").strip(),
+            session_path=os.path.join(session_dir, session_filename),
+            target_default=os.environ.get("TARGET_CHANNEL", "").strip(),
+        )
 
 
 class BotRuntime:
+    # How long to wait for a state-change notification before re-checking anyway.
+    HEARTBEAT_SECONDS = 5.0
+
+    # How long a fetched bot_state row is trusted without even a version check.
+    STATE_CACHE_TTL_SECONDS = 0.5
+
+    # Coalescing window for connected/error status writes: connection flaps
+    # produce one DB write with the final value instead of one per blip.
+    STATUS_DEBOUNCE_SECONDS = 0.25
+
+    # Reconnect backoff bounds (jittered exponential, reset on success).
+    BACKOFF_MAX_SECONDS = 60.0
+
+    # How long the in-memory keyword list is reused before re-reading the DB.
+    # Keyword edits are rare and human-driven; a few seconds of staleness is
+    # invisible next to saving one round trip per incoming message.
+    KEYWORDS_CACHE_TTL_SECONDS = 3.0
+
     def __init__(self, repo: Repo) -> None:
         self._repo = repo
         self._stop_event = asyncio.Event()
         self._task: asyncio.Task | None = None
 
+        # Set by the web UI when bot_state changes; wakes the run loop immediately
+        # instead of waiting for the next poll tick.
+        self._state_dirty = asyncio.Event()
+
+        # Short-lived bot_state cache; invalidated by notify_state_changed().
+        self._cached_state: BotState | None = None
+        self._cached_state_at: float = 0.0
+
         self._client: TelegramClient | None = None
 
+        # Env-derived config; built lazily on first connect attempt.
+        self._cfg: TelethonConfig | None = None
+        self._session_file_seen: bool = False
+
+        # Consecutive failed connect attempts, drives reconnect backoff.
+        self._fail_count: int = 0
+
         # Target channel cache (resolved from dialogs by title)
         self._target_chat_id: int | None = None
         self._target_title: str | None = None
 
+        # In-memory (normalized title -> chat id) memo layered over the
+        # persistent app_settings cache; skips even the DB reads on reconnect.
+        self._resolved_target: tuple[str, int] | None = None
+
+        # Ready-made input peer for the target: send/forward skip entity
+        # resolution, and the stored access hash lets it be rebuilt without a
+        # dialogs scan even when the session entity cache was lost.
+        self._target_peer: InputPeerChannel | InputPeerChat | InputPeerUser | None = None
+        self._resolved_entity = None
+
         # Live handlers lifecycle
         self._handlers_installed: bool = False
+        self._live_handler = None
+
+        # Bounded hand-off between Telethon dispatch and message processing,
+        # so slow DB/forward work never backpressures the update receiver.
+        self._msg_queue: asyncio.Queue[tuple[int, object]] | None = None
+        self._consumer_task: asyncio.Task | None = None
         self._checkpoints_initialized: bool = False
         self._backfill_completed: bool = False
 
+        # Short-TTL keyword cache: (normalized, original) pairs so the match
+        # loop never re-normalizes keywords per message.
+        self._keywords_cache: list[tuple[str, str]] | None = None
+        self._keywords_cache_at: float = 0.0
+
         # Local in-memory cache to avoid spamming DB with the same status updates.
         self._connected_cache: bool | None = None
         self._last_error_cache: str | None = None
 
+        # Debounced status writes: latest pending values plus a single timer.
+        self._pending_status: dict[str, object] = {}
+        self._status_flush_handle: asyncio.TimerHandle | None = None
+        self._status_flush_task: asyncio.Task | None = None
+
     async def start(self) -> None:
         if self._task is None:
+            # LISTEN/NOTIFY wakes the loop for bot_state changes made by other
+            # processes; the heartbeat still covers us if the listener fails.
+            try:
+                await self._repo.bot_state_listen(self._on_state_notify)
+            except Exception:
+                pass
             self._task = asyncio.create_task(self._run_loop())
 
     async def stop(self) -> None:
         self._stop_event.set()
+        self._state_dirty.set()  # wake the loop so it can observe the stop flag
         if self._task:
             await self._task
+        try:
+            await self._repo.bot_state_unlisten(self._on_state_notify)
+        except Exception:
+            pass
+
+    def _on_state_notify(self, conn, pid, channel, payload) -> None:
+        """
+        asyncpg notification callback for the bot_state_changed channel.
+        The 0018 trigger ships the row as JSON, so the cache is refreshed
+        right here without a follow-up SELECT; a malformed/empty payload
+        (e.g. the pre-0018 trigger) degrades to plain invalidation.
+        """
+        try:
+            data = json.loads(payload)
+            restart_raw = data.get("restart_requested_at")
+            state = BotState(
+                enabled=bool(data["enabled"]),
+                restart_requested_at=(
+                    datetime.fromisoformat(restart_raw) if restart_raw else None
+                ),
+                version=int(data.get("version") or 0),
+            )
+        except (ValueError, KeyError, TypeError):
+            self.notify_state_changed()
+            return
+        self._cached_state = state
+        self._cached_state_at = time.monotonic()
+        self._state_dirty.set()
+
+    def notify_state_changed(self) -> None:
+        """Called from web handlers after mutating bot_state; wakes the run loop."""
+        self._cached_state = None
+        self._state_dirty.set()
+
+    async def _bot_state_cached(self) -> BotState:
+        """
+        Returns bot_state, hitting the DB only when the cache is stale.
+        A stale cache first does a single-int version check and re-fetches
+        the full row only when the version actually advanced.
+        """
+        now = time.monotonic()
+        if self._cached_state is not None:
+            if now - self._cached_state_at < self.STATE_CACHE_TTL_SECONDS:
+                return self._cached_state
+            version = await self._repo.bot_state_get_version()
+            if version == self._cached_state.version:
+                self._cached_state_at = now
+                return self._cached_state
+
+        self._cached_state = await self._repo.bot_state_get()
+        self._cached_state_at = now
+        return self._cached_state
 
     def get_client(self) -> TelegramClient | None:
         """Returns Telethon client when created."""
@@ -51,17 +209,15 @@ class BotRuntime:
 
     def is_target_chat(self, chat_id: int | None) -> bool:
         """Prevent infinite forwarding loops."""
-        if chat_id is None or self._target_chat_id is None:
-            return False
-        return int(chat_id) == int(self._target_chat_id)
+        # Both sides are ints already (chat ids are normalized on resolve),
+        # so no defensive int() conversions on the per-message path.
+        return chat_id is not None and chat_id == self._target_chat_id
 
     def should_monitor_chat(self, chat_id: int | None) -> bool:
         """Centralized rule: never monitor the target channel."""
-        if chat_id is None:
-            return False
-        if self.is_target_chat(chat_id):
-            return False
-        return True
+        # Single expression on the per-message hot path; an unresolved target
+        # (None) never equals a real chat id, so monitoring stays allowed.
+        return chat_id is not None and chat_id != self._target_chat_id
 
     async def _run_loop(self) -> None:
         last_restart_seen: datetime | None = None
@@ -69,87 +225,124 @@ class BotRuntime:
 
         try:
             while not self._stop_event.is_set():
-                state = await self._repo.bot_state_get()
+                self._state_dirty.clear()
+                state = await self._bot_state_cached()
 
                 # Soft-restart requested from UI.
                 if state.restart_requested_at and state.restart_requested_at != last_restart_seen:
                     last_restart_seen = state.restart_requested_at
                     await self._repo.app_status_set_event("Soft restart requested")
-                    await self._disconnect_client()
+                    await self._pause_client()
                     await self._set_connected(False)
-                    await asyncio.sleep(1)
+                    await self._wait_state_change(self.HEARTBEAT_SECONDS)
                     continue
 
                 # Disabled from UI.
                 if not state.enabled:
-                    await self._disconnect_client()
+                    await self._pause_client()
                     await self._set_connected(False)
-                    await asyncio.sleep(1)
+                    await self._wait_state_change(self.HEARTBEAT_SECONDS)
                     continue
 
                 # Enabled: ensure Telegram connection exists.
                 ok = await self._ensure_connected()
 
-                # If we can't connect right now, back off a little.
-                await asyncio.sleep(1 if ok else 3)
+                if ok:
+                    self._fail_count = 0
+                    await self._wait_state_change(self.HEARTBEAT_SECONDS)
+                else:
+                    # Jittered exponential backoff: retrying a dead connection
+                    # every few seconds only risks FLOOD_WAIT and DB churn.
+                    self._fail_count += 1
+                    delay = min(self.BACKOFF_MAX_SECONDS, 1.5 ** self._fail_count)
+                    await self._wait_state_change(delay * random.uniform(0.8, 1.2))
 
         except Exception as exc:
             await self._repo.app_status_set_error(str(exc))
             await self._repo.event_error_add(str(exc))
             raise
         finally:
-            await self._disconnect_client()
+            await self._shutdown_client()
             await self._set_connected(False)
+            if self._status_flush_handle is not None:
+                self._status_flush_handle.cancel()
+                self._status_flush_handle = None
+            if self._status_flush_task is not None:
+                # Let an in-flight flush finish before the pool starts
+                # closing underneath it.
+                try:
+                    await self._status_flush_task
+                except Exception:
+                    pass
+                self._status_flush_task = None
+            await self._flush_status()
             await self._repo.app_status_set_event("Bot runtime stopped")
 
+    async def _wait_state_change(self, timeout: float) -> None:
+        """Sleeps until the UI signals a bot_state change or the timeout elapses."""
+        try:
+            await asyncio.wait_for(self._state_dirty.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _ensure_connected(self) -> bool:
         try:
-            api_id_raw = os.environ.get("TELEGRAM_API_ID", "").strip()
-            api_hash = os.environ.get("TELEGRAM_API_HASH", "").strip()
-            session_dir = os.environ.get("TELEGRAM_SESSION_DIR", "/app/session").strip()
-            session_filename = os.environ.get("TELEGRAM_SESSION_FILE", "monitor.session").strip()
-            session_path = os.path.join(session_dir, session_filename)
-
-            env_target = os.environ.get("TARGET_CHANNEL", "").strip()
-            target_title = (await self._repo.app_setting_get("target_channel", env_target) or "").strip()
+            if self._cfg is None:
+                self._cfg = TelethonConfig.from_env()
+            cfg = self._cfg
+
+            target_title = (await self._repo.app_setting_get("target_channel", cfg.target_default) or "").strip()
             if not target_title:
                 await self._set_error("Missing TARGET_CHANNEL in .env (must be target channel title)")
                 await self._set_connected(False)
                 return False
 
-            api_id = int(api_id_raw or "0")
-            if api_id <= 0 or not api_hash:
+            if cfg.api_id <= 0 or not cfg.api_hash:
                 await self._set_error("Missing TELEGRAM_API_ID / TELEGRAM_API_HASH in .env")
                 await self._set_connected(False)
                 return False
 
-            if not os.path.exists(session_path):
-                await self._set_error(f"Session file not found: {session_path}")
-                await self._set_connected(False)
-                return False
+            # Telethon silently creates a blank (unauthorized) session when the
+            # file is missing, so the existence check must happen before the
+            # client is constructed — but once the file has been seen, re-stating
+            # it on every reconnect buys nothing.
+            if not self._session_file_seen:
+                # Stat via the default executor: session volumes are often
+                # network mounts in Docker, and a slow stat would stall every
+                # other coroutine on the loop.
+                if not await asyncio.to_thread(os.path.exists, cfg.session_path):
+                    await self._set_error(f"Session file not found: {cfg.session_path}")
+                    await self._set_connected(False)
+                    return False
+                self._session_file_seen = True
 
             if self._client is None:
                 # Telethon can accept full session path (string); it will create additional files if needed.
-                self._client = TelegramClient(session_path, api_id, api_hash)
+                self._client = TelegramClient(cfg.session_path, cfg.api_id, cfg.api_hash)
                 await self._repo.app_status_set_event("Telethon client created")
 
+            reconnected = False
             if not self._client.is_connected():
                 await self._client.connect()
+                reconnected = True
 
             if not await self._client.is_user_authorized():
                 await self._set_error("Telegram session is not authorized. Re-create .session using tools/login.py")
                 await self._disconnect_client()
                 await self._set_connected(False)
                 return False
-            # Ensure no updates gap after reconnect (important for channels with high traffic).
-            try:
-                await self._client.catch_up()
-            except Exception as exc:
-                # Do not fail connection, but report the issue for visibility.
-                await self._repo.app_status_set_error(f"Telethon catch_up failed: {exc}")
-                await self._repo.event_error_add(f"Telethon catch_up failed: {exc}")
-            # Resolve target channel id by title (dialogs scan).
-            resolved = await self._resolve_target_channel_id(target_title)
+            # Ensure no updates gap after reconnect (important for channels with
+            # high traffic). A paused-but-connected client has no gap, so only
+            # a fresh socket pays for the catch_up round trips.
+            if reconnected:
+                try:
+                    await self._client.catch_up()
+                except Exception as exc:
+                    # Do not fail connection, but report the issue for visibility.
+                    await self._repo.app_status_set_error(f"Telethon catch_up failed: {exc}")
+                    await self._repo.event_error_add(f"Telethon catch_up failed: {exc}")
+            # Resolve target channel id: cached id first, dialogs scan on miss.
+            resolved = await self._resolve_target_with_cache(target_title)
             if resolved is None:
                 await self._set_connected(False)
                 await self._disconnect_client()
@@ -207,10 +400,17 @@ class BotRuntime:
         """
         Live monitoring for all groups and channels the account is subscribed to.
         IMPORTANT: Do not call get_chat()/get_entity() here (hot path).
+        The handler only enqueues; a dedicated consumer task does the actual
+        keyword matching and forwarding so Telethon returns to reading updates
+        immediately.
         """
         if self._client is None:
             return
 
+        queue: asyncio.Queue[tuple[int, object]] = asyncio.Queue(maxsize=1000)
+        self._msg_queue = queue
+        self._consumer_task = asyncio.create_task(self._consume_messages(queue))
+
         async def _on_new_message(event: events.NewMessage.Event) -> None:
             try:
                 chat_id = int(event.chat_id) if event.chat_id is not None else None
@@ -219,12 +419,116 @@ class BotRuntime:
                 if not self.should_monitor_chat(chat_id):
                     return
 
-                await self._process_message(chat_id, event.message, is_backfill=False)
+                try:
+                    queue.put_nowait((chat_id, event.message))
+                except asyncio.QueueFull:
+                    # Bounded by design: losing one message beats unbounded
+                    # memory growth during a firehose burst.
+                    await self._set_error("Message queue full; dropping incoming message")
             except Exception as exc:
                 await self._repo.app_status_set_error(str(exc))
                 await self._repo.event_error_add(str(exc))
 
-        self._client.add_event_handler(_on_new_message, events.NewMessage())
+        self._live_handler = _on_new_message
+        # blacklist_chats drops target-channel updates inside Telethon's
+        # dispatcher, so its own posts never even schedule the callback; the
+        # should_monitor_chat guard above stays as loop-protection defense.
+        self._client.add_event_handler(
+            _on_new_message,
+            events.NewMessage(chats=[self._target_chat_id], blacklist_chats=True),
+        )
+
+    async def _consume_messages(self, queue: asyncio.Queue[tuple[int, object]]) -> None:
+        while True:
+            chat_id, message = await queue.get()
+            try:
+                await self._process_message(chat_id, message, is_backfill=False)
+            except Exception as exc:
+                await self._repo.app_status_set_error(str(exc))
+                await self._repo.event_error_add(str(exc))
+            finally:
+                queue.task_done()
+
+    async def _resolve_target_with_cache(self, target_title: str) -> int | None:
+        """
+        Fast path: reuse the (title -> chat_id) mapping persisted in app_settings
+        and validate it with a single get_input_entity call, skipping the full
+        dialogs scan. Falls back to the scan on cache miss or stale entries and
+        re-persists the result.
+        """
+        wanted = self._normalize_title(target_title)
+
+        cached_id: int | None = None
+        if self._resolved_target is not None and self._resolved_target[0] == wanted:
+            cached_id = self._resolved_target[1]
+        else:
+            stored_title = await self._repo.app_setting_get("target_chat_title_norm")
+            stored_id = await self._repo.app_setting_get("target_chat_id")
+            if stored_title == wanted and stored_id and stored_id.lstrip("-").isdecimal():
+                cached_id = int(stored_id)
+
+        if self._client is not None and cached_id is not None:
+            try:
+                self._target_peer = await self._client.get_input_entity(cached_id)
+                self._resolved_target = (wanted, cached_id)
+                return cached_id
+            except Exception:
+                # Session entity cache lost: rebuild the input peer from the
+                # persisted access hash instead of paying for a full scan.
+                peer = await self._load_stored_peer()
+                if peer is not None:
+                    self._target_peer = peer
+                    self._resolved_target = (wanted, cached_id)
+                    return cached_id
+                # No stored peer either (pre-hash cache entry) -> full scan.
+                self._resolved_target = None
+
+        resolved = await self._resolve_target_channel_id(target_title)
+        if resolved is not None:
+            self._resolved_target = (wanted, resolved)
+            await self._repo.app_setting_set("target_chat_id", str(resolved))
+            await self._repo.app_setting_set("target_chat_title_norm", wanted)
+            await self._persist_target_peer(self._resolved_entity)
+        return resolved
+
+    async def _load_stored_peer(self) -> InputPeerChannel | InputPeerChat | InputPeerUser | None:
+        kind = await self._repo.app_setting_get("target_peer_kind") or ""
+        raw_id = await self._repo.app_setting_get("target_peer_id") or ""
+        access_hash = await self._repo.app_setting_get("target_peer_hash") or ""
+        if not kind or not raw_id.isdecimal() or not access_hash.lstrip("-").isdecimal():
+            return None
+        return self._peer_from_stored(kind, int(raw_id), int(access_hash))
+
+    async def _persist_target_peer(self, entity) -> None:
+        """
+        Stores the target entity kind, bare id and access hash in app_settings
+        so later reconnects can construct the input peer with zero RPC calls.
+        """
+        if isinstance(entity, Channel):
+            kind = "channel"
+        elif isinstance(entity, Chat):
+            kind = "chat"
+        elif isinstance(entity, User):
+            kind = "user"
+        else:
+            return
+        access_hash = int(getattr(entity, "access_hash", 0) or 0)
+        self._target_peer = self._peer_from_stored(kind, int(entity.id), access_hash)
+        await self._repo.app_setting_set("target_peer_kind", kind)
+        await self._repo.app_setting_set("target_peer_id", str(entity.id))
+        await self._repo.app_setting_set("target_peer_hash", str(access_hash))
+
+    @staticmethod
+    def _peer_from_stored(
+        kind: str, raw_id: int, access_hash: int
+    ) -> InputPeerChannel | InputPeerChat | InputPeerUser | None:
+        if kind == "channel":
+            return InputPeerChannel(raw_id, access_hash)
+        if kind == "chat":
+            return InputPeerChat(raw_id)
+        if kind == "user":
+            return InputPeerUser(raw_id, access_hash)
+        return None
 
     async def _resolve_target_channel_id(self, target_title: str) -> int | None:
         if self._client is None:
@@ -233,30 +537,43 @@ class BotRuntime:
 
         wanted = self._normalize_title(target_title)
 
-        matches: list[int] = []
-        async for dialog in self._client.iter_dialogs():
-            name = (dialog.name or "").strip()
-            if not name:
+        found_id: int | None = None
+        ambiguous = False
+        processed = 0
+        # ignore_migrated skips legacy chats that were upgraded to megagroups,
+        # so those are neither fetched as duplicates nor normalized twice.
+        async for dialog in self._client.iter_dialogs(limit=None, ignore_migrated=True):
+            # Dialogs inside one fetched page are delivered without touching the
+            # event loop; yield periodically so HTTP handlers stay responsive
+            # while thousands of dialogs are scanned.
+            processed += 1
+            if processed % 64 == 0:
+                await asyncio.sleep(0)
+            if not self._titles_equal(wanted, dialog.name or ""):
                 continue
-            if self._normalize_title(name) != wanted:
+            if found_id is None:
+                found_id = int(dialog.id)
+                self._resolved_entity = dialog.entity
                 continue
-            matches.append(int(dialog.id))
+            # A second match is enough to report a duplicate; stop scanning.
+            ambiguous = True
+            break
 
-        if not matches:
+        if found_id is None:
             await self._set_error(
                 f'Target channel with title "{target_title}" was not found in account dialogs. '
                 f"Make sure the account is already joined and the title matches exactly."
             )
             return None
 
-        if len(matches) > 1:
+        if ambiguous:
             await self._set_error(
                 f'Multiple dialogs found with title "{target_title}". '
                 f"Rename the target channel to a unique title to avoid sending to a wrong destination."
             )
             return None
 
-        return matches[0]
+        return found_id
 
     async def _initialize_checkpoints(self) -> None:
         if self._client is None:
@@ -339,16 +656,17 @@ class BotRuntime:
                 return
 
             raw_text = (getattr(message, "message", "") or "").strip()
-            preview_text = raw_text
-            if len(preview_text) > 120:
-                preview_text = preview_text[:120] + "..."
 
-            keywords = await self._repo.keyword_all()
+            keywords = await self._keywords_cached()
             matched = self._find_keywords(raw_text, keywords)
 
             if not matched:
                 return
 
+            # Only matched messages need a preview; single slice, no copy for
+            # short texts.
+            preview_text = raw_text if len(raw_text) <= 120 else raw_text[:117] + "..."
+
             pending_timeout = int(os.environ.get("FORWARD_PENDING_TIMEOUT_SECONDS", "300").strip() or "300")
             claimed = await self._repo.forwarded_claim(chat_id, msg_id, pending_timeout)
             if not claimed:
@@ -356,16 +674,19 @@ class BotRuntime:
 
             prefix = f"Matched keywords: {', '.join(matched)} | "
             source = "backfill" if is_backfill else "live"
-            await self._repo.app_status_set_event(
+            self._set_event(
                 f"{prefix}{source} message: chat_id={chat_id} message_id={msg_id} text={preview_text}"
             )
 
             if self._client is None or self._target_chat_id is None:
                 raise RuntimeError("Target channel is not resolved")
 
+            # The ready-made input peer avoids per-send entity resolution; the
+            # marked chat id stays as a fallback for old cache entries.
+            target = self._target_peer if self._target_peer is not None else self._target_chat_id
             notify_text = f"В посте найдены следующие ключевые слова: {', '.join(matched)}"
-            await self._client.send_message(self._target_chat_id, notify_text)
-            await self._client.forward_messages(self._target_chat_id, message)
+            await self._client.send_message(target, notify_text)
+            await self._client.forward_messages(target, message)
             await self._repo.forwarded_mark_sent(chat_id, msg_id)
         except Exception as exc:
             if claimed and msg_id:
@@ -382,32 +703,62 @@ class BotRuntime:
             return False
         return getattr(message, "reply_to", None) is None
 
+    @classmethod
+    def _titles_equal(cls, wanted_norm: str, raw_name: str) -> bool:
+        """
+        Hot-loop comparison against an already-normalized wanted title.
+        Most titles are already in normal form, so a single C-level string
+        compare settles them without the translate/lower/split machinery.
+        """
+        name = raw_name.strip()
+        if not name:
+            return False
+        if name == wanted_norm:
+            return True
+        return cls._normalize_title(name) == wanted_norm
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _normalize_title(value: str) -> str:
-        v = value.strip().lower().replace("ё", "е")
-        v = re.sub(r"\s+", " ", v)
-        return v
+        # Dialog titles repeat across scans, so the result is memoized.
+        # split()/join collapses (and strips) all whitespace in C.
+        return " ".join(value.translate(_YO_FOLD).casefold().split())
 
     @staticmethod
     def _normalize_text(value: str) -> str:
-        v = value.strip().lower().replace("ё", "е")
-        v = re.sub(r"\s+", " ", v)
-        return v
-
-    def _find_keywords(self, text: str, keywords: list[str]) -> list[str]:
-        if not text or not keywords:
+        # Message texts are unique; same normalization, but no memoization.
+        return " ".join(value.translate(_YO_FOLD).casefold().split())
+
+    async def _keywords_cached(self) -> list[tuple[str, str]]:
+        now = time.monotonic()
+        if (
+            self._keywords_cache is None
+            or now - self._keywords_cache_at >= self.KEYWORDS_CACHE_TTL_SECONDS
+        ):
+            pairs: list[tuple[str, str]] = []
+            for keyword in await self._repo.keyword_all():
+                normalized = self._normalize_text(keyword)
+                if normalized:
+                    pairs.append((normalized, keyword))
+            self._keywords_cache = pairs
+            self._keywords_cache_at = now
+        return self._keywords_cache
+
+    def _find_keywords(self, text: str, keyword_pairs: list[tuple[str, str]]) -> list[str]:
+        if not text or not keyword_pairs:
             return []
         normalized_text = self._normalize_text(text)
-        matched: list[str] = []
-        for keyword in keywords:
-            normalized_keyword = self._normalize_text(keyword)
-            if not normalized_keyword:
-                continue
-            if normalized_keyword in normalized_text:
-                matched.append(keyword)
-        return matched
+        # `in` is a C-level substring scan; with keywords pre-normalized the
+        # per-message Python work is one normalization plus K scans.
+        return [keyword for normalized, keyword in keyword_pairs if normalized in normalized_text]
 
-    async def _disconnect_client(self) -> None:
+    async def _pause_client(self) -> None:
+        """
+        Stops monitoring but keeps the MTProto socket connected: UI disable and
+        soft restart do not pay for a new TLS+MTProto handshake on re-enable.
+        With no handlers installed, incoming updates are dropped by Telethon
+        without reaching Python callbacks.
+        """
         # Reset caches related to Telegram session
         self._target_chat_id = None
         self._target_title = None
@@ -415,21 +766,55 @@ class BotRuntime:
         self._checkpoints_initialized = False
         self._backfill_completed = False
 
+        if self._client is None:
+            return
+
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+        self._msg_queue = None
+
+        # The handler is re-installed on the next connect; remove the old one
+        # so the retained client does not accumulate duplicates.
+        if self._live_handler is not None:
+            try:
+                self._client.remove_event_handler(self._live_handler)
+            except Exception:
+                pass
+            self._live_handler = None
+
+    async def _disconnect_client(self) -> None:
+        """
+        Pauses and drops the connection, but keeps the client instance: the
+        session file, auth key and entity cache survive, so the next connect
+        skips re-reading the .session DB and re-deriving keys. Used on error
+        paths where the socket itself may be broken.
+        """
+        await self._pause_client()
+
         if self._client is None:
             return
         try:
             if self._client.is_connected():
                 await asyncio.wait_for(self._client.disconnect(), timeout=10)
         except Exception:
-            pass
-        finally:
+            # A client that cannot even disconnect cleanly is not worth keeping.
             self._client = None
 
+    async def _shutdown_client(self) -> None:
+        """Full teardown, used when the runtime itself stops."""
+        await self._disconnect_client()
+        self._client = None
+
     async def _set_connected(self, connected: bool) -> None:
-        if self._connected_cache is connected:
+        if connected == self._connected_cache:
             return
         self._connected_cache = connected
-        await self._repo.app_status_set_connected(connected)
+        self._queue_status_write("connected", connected)
 
     async def _set_error(self, error: str | None) -> None:
         if error == self._last_error_cache:
@@ -437,5 +822,54 @@ class BotRuntime:
         self._last_error_cache = error
         if error is None:
             return
-        await self._repo.app_status_set_error(error)
-        await self._repo.event_error_add(error)
+        self._queue_status_write("error", error)
+
+    def _set_event(self, message: str) -> None:
+        """
+        Debounced last-event write for hot paths: only the newest message
+        within the window reaches the DB, which is all the UI shows anyway.
+        """
+        self._queue_status_write("event", message)
+
+    def _queue_status_write(self, key: str, value: object) -> None:
+        """
+        Stores the desired status value and schedules a flush. Repeated calls
+        within the window overwrite the pending value without re-arming the
+        timer, so a flap collapses into one write of the final state.
+        """
+        self._pending_status[key] = value
+        if self._status_flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._status_flush_handle = loop.call_later(
+                self.STATUS_DEBOUNCE_SECONDS, self._schedule_status_flush
+            )
+
+    def _schedule_status_flush(self) -> None:
+        self._status_flush_handle = None
+        # The loop only holds weak references to running tasks; keep a strong
+        # one so the flush cannot be garbage-collected mid-write, and so
+        # shutdown can wait for an in-flight flush.
+        task = asyncio.create_task(self._flush_status())
+        self._status_flush_task = task
+        task.add_done_callback(self._clear_status_flush_task)
+
+    def _clear_status_flush_task(self, task: asyncio.Task) -> None:
+        if self._status_flush_task is task:
+            self._status_flush_task = None
+
+    async def _flush_status(self) -> None:
+        pending, self._pending_status = self._pending_status, {}
+        if not pending:
+            return
+        connected = bool(pending["connected"]) if "connected" in pending else None
+        error = str(pending["error"]) if "error" in pending else None
+        try:
+            # One coalesced app_status write per flush instead of one per field.
+            await self._repo.app_status_flush(connected, error)
+            if error is not None:
+                await self._repo.event_error_add(error)
+            if "event" in pending:
+                await self._repo.app_status_set_event(str(pending["event"]))
+        except Exception:
+            # Status reporting must never take the runtime down.
+            pass
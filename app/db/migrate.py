@@ -1,3 +1,4 @@
+import asyncio
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,17 +15,25 @@ class Migration:
 MIGRATIONS_DIR = (Path(__file__).resolve().parent / "migrations").resolve()
 
 
-async def load_migrations() -> list[Migration]:
+def list_migration_files() -> list[os.DirEntry]:
     if not MIGRATIONS_DIR.is_dir():
         raise RuntimeError(f"Migrations dir not found: {MIGRATIONS_DIR}")
 
-    files = sorted([p for p in MIGRATIONS_DIR.glob("*.sql") if p.is_file()])
+    # One scandir syscall for listing (entry type comes for free).
     # Ensure initial schema is applied before any incremental migrations.
-    files = sorted(
-        files,
-        key=lambda p: (0 if p.name == "001_init.sql" else 1, p.name),
+    return sorted(
+        (e for e in os.scandir(MIGRATIONS_DIR) if e.name.endswith(".sql") and e.is_file()),
+        key=lambda e: (0 if e.name == "001_init.sql" else 1, e.name),
     )
-    return [Migration(filename=p.name, sql=p.read_text(encoding="utf-8")) for p in files]
+
+
+async def load_migrations(entries: list[os.DirEntry]) -> list[Migration]:
+    # The blocking file reads fan out to the default executor instead of
+    # running serially on the event loop.
+    texts = await asyncio.gather(
+        *[asyncio.to_thread(Path(e.path).read_text, encoding="utf-8") for e in entries]
+    )
+    return [Migration(filename=e.name, sql=sql) for e, sql in zip(entries, texts)]
 
 
 async def table_exists(conn: asyncpg.Connection, table_name: str) -> bool:
@@ -104,14 +113,24 @@ async def apply_migrations(database_url: str) -> None:
 
         await ensure_schema_migrations(conn)
 
-        applied_rows = await conn.fetch("SELECT filename FROM schema_migrations;")
+        entries = list_migration_files()
+
+        # Filter server-side: only rows matching on-disk filenames come back,
+        # so the fetch stays bounded by the migration set rather than by the
+        # table history.
+        applied_rows = await conn.fetch(
+            "SELECT filename FROM schema_migrations WHERE filename = ANY($1::text[]);",
+            [e.name for e in entries],
+        )
         applied = {r["filename"] for r in applied_rows}
 
-        migrations = await load_migrations()
-        for m in migrations:
-            if m.filename in applied:
-                continue
+        # The common restart has nothing to apply: decide from filenames
+        # alone and skip reading any SQL off disk.
+        pending = [e for e in entries if e.name not in applied]
+        if not pending:
+            return
 
+        for m in await load_migrations(pending):
             async with conn.transaction():
                 await conn.execute(m.sql)
                 await conn.execute(
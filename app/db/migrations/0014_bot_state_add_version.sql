@@ -0,0 +1,5 @@
+-- 0014_bot_state_add_version.sql
+-- Monotonic version for cheap change detection: readers compare the version
+-- before re-fetching the full row.
+
+ALTER TABLE bot_state ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0;
@@ -0,0 +1,15 @@
+-- 0015_bot_state_notify_trigger.sql
+-- Wake listeners on bot_state changes so the bot runtime does not have to
+-- poll the row; works across processes, unlike the in-process event alone.
+
+CREATE OR REPLACE FUNCTION notify_bot_state_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('bot_state_changed', '');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bot_state_changed_trigger ON bot_state;
+CREATE TRIGGER bot_state_changed_trigger
+    AFTER INSERT OR UPDATE ON bot_state
+    FOR EACH ROW EXECUTE FUNCTION notify_bot_state_changed();
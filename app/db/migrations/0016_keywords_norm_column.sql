@@ -0,0 +1,13 @@
+-- 0016_keywords_norm_column.sql
+-- Precomputed normalized keyword form (lowercase, yo folded) so searches stop
+-- re-normalizing every row per query, plus a trigram index that serves the
+-- %substring% pattern used by the keywords page.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE keywords
+    ADD COLUMN IF NOT EXISTS keyword_norm TEXT
+    GENERATED ALWAYS AS (lower(translate(keyword, 'Ёё', 'Ее'))) STORED;
+
+CREATE INDEX IF NOT EXISTS keywords_norm_trgm_idx
+    ON keywords USING gin (keyword_norm gin_trgm_ops);
@@ -0,0 +1,10 @@
+-- 0017_cleanup_brin_indexes.sql
+-- BRIN indexes for the nightly retention deletes: both tables are append-only
+-- and time-ordered, so a BRIN over created_at turns the cutoff scan into a
+-- block-range scan at a fraction of a B-tree's size.
+
+CREATE INDEX IF NOT EXISTS event_log_created_brin
+    ON event_log USING BRIN (created_at);
+
+CREATE INDEX IF NOT EXISTS forwarded_messages_created_brin
+    ON forwarded_messages USING BRIN (created_at);
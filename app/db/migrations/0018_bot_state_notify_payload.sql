@@ -0,0 +1,10 @@
+-- 0018_bot_state_notify_payload.sql
+-- Carry the changed row in the notification payload so listeners can refresh
+-- their in-memory bot_state without a follow-up SELECT.
+
+CREATE OR REPLACE FUNCTION notify_bot_state_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('bot_state_changed', row_to_json(NEW)::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
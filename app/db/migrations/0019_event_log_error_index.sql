@@ -0,0 +1,8 @@
+-- 0019_event_log_error_index.sql
+-- The logs page reads only error rows, newest first; a partial descending
+-- index lets Postgres pull each page straight off the index tail instead of
+-- filtering the full created_at index.
+
+CREATE INDEX IF NOT EXISTS event_log_error_created_idx
+    ON event_log (created_at DESC)
+    WHERE level = 'error';
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
+import contextlib
+import time
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, AsyncIterator
 
 import asyncpg
 
+_UTC = timezone.utc
+
+
+def _utc_now() -> datetime:
+    # One module-level tz object instead of re-reading timezone.utc on every
+    # hot-path call for the same constant.
+    return datetime.now(_UTC)
+
+
+def _truncate_utf8(value: str, limit_bytes: int = 4000) -> str:
+    """
+    Byte-budget truncation for error/event text: exception reprs can embed
+    whole payloads, and a codepoint slice could split a multi-byte character.
+    The cheap len() check means normal-sized strings pay for one encode only
+    when they are actually over budget.
+    """
+    if len(value) * 4 <= limit_bytes:
+        return value
+    encoded = value.encode("utf-8")
+    if len(encoded) <= limit_bytes:
+        return value
+    return encoded[:limit_bytes].decode("utf-8", "ignore")
+
+
+# Connection bound to the current task by Repo.connection(); repo calls inside
+# that scope reuse it instead of checking out from the pool per call.
+_bound_conn: ContextVar[asyncpg.Connection | None] = ContextVar("repo_conn", default=None)
+
 
 @dataclass(frozen=True)
 class BotState:
     enabled: bool
     restart_requested_at: datetime | None
+    version: int = 0
 
 
 @dataclass(frozen=True)
@@ -22,14 +54,67 @@ class AppStatus:
 
 
 class Repo:
+    __slots__ = (
+        "_pool",
+        "_listen_conn",
+        "_bot_state_cache",
+        "_bot_state_cache_at",
+        "_app_status_cache",
+        "_app_status_cache_at",
+        "_setting_cache",
+    )
+
+    # The dashboard JS polls /api/status every few seconds and the bot loop
+    # re-reads bot_state on every tick; one second of staleness on these two
+    # singleton rows is invisible, while a read burst collapses to one query.
+    SINGLETON_CACHE_TTL_SECONDS = 1.0
+
+    # Settings are only ever written through app_setting_set in this process,
+    # so the TTL matters only for edits made directly in the database.
+    SETTING_CACHE_TTL_SECONDS = 30.0
+
     def __init__(self, pool: asyncpg.Pool) -> None:
         self._pool = pool
+        self._listen_conn: asyncpg.Connection | None = None
+        self._bot_state_cache: BotState | None = None
+        self._bot_state_cache_at: float = 0.0
+        self._app_status_cache: AppStatus | None = None
+        self._app_status_cache_at: float = 0.0
+        self._setting_cache: dict[str, tuple[float, str | None]] = {}
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """Reuses the task-bound connection when inside a connection() scope,
+        otherwise checks one out from the pool for just this call."""
+        conn = _bound_conn.get()
+        if conn is not None:
+            yield conn
+            return
+        async with self._pool.acquire() as conn:
+            yield conn
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator[None]:
+        """
+        Binds one pool connection to the current task (ContextVar scoped), so a
+        handler making several repo calls pays for a single pool checkout
+        instead of one per call. Nesting reuses the outer scope's connection.
+        """
+        if _bound_conn.get() is not None:
+            yield
+            return
+        async with self._pool.acquire() as conn:
+            token = _bound_conn.set(conn)
+            try:
+                yield
+            finally:
+                _bound_conn.reset(token)
 
     # ----------------------------
     # Keywords
     # ----------------------------
     async def keyword_create(self, word: str) -> None:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO keywords(keyword)
@@ -39,19 +124,57 @@ class Repo:
                 word,
             )
 
+    async def keyword_bulk_create(self, words: list[str]) -> int:
+        """
+        Bulk import: stream the words into a temp table over the binary COPY
+        protocol (no per-row parse/plan), then fold them into keywords with a
+        single ON CONFLICT insert. Returns the number of new rows.
+        """
+        cleaned = {w.strip() for w in words}
+        cleaned.discard("")
+        if not cleaned:
+            return 0
+
+        async with self._acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "CREATE TEMP TABLE keywords_stage(keyword TEXT) ON COMMIT DROP;"
+                )
+                await conn.copy_records_to_table(
+                    "keywords_stage",
+                    records=[(w,) for w in cleaned],
+                )
+                inserted = await conn.fetchval(
+                    """
+                    WITH ins AS (
+                        INSERT INTO keywords(keyword)
+                        SELECT keyword FROM keywords_stage
+                            ON CONFLICT (keyword) DO NOTHING
+                        RETURNING 1
+                    )
+                    SELECT COUNT(*) FROM ins;
+                    """
+                )
+                return int(inserted or 0)
+
     async def keyword_delete(self, word: str) -> None:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute("DELETE FROM keywords WHERE keyword = $1;", word)
 
     async def keyword_list(self, q: str | None, limit: int, offset: int) -> tuple[list[str], int]:
         q = (q or "").strip()
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
+            # COUNT(*) OVER () returns the pre-LIMIT total alongside each page
+            # row, fusing the old COUNT+SELECT pair into one round trip.
             if q:
+                # keyword_norm is the stored generated column (0016); the
+                # trigram index serves the %substring% pattern, and folding the
+                # parameter the same way keeps the search yo/case-insensitive.
                 rows = await conn.fetch(
                     """
-                    SELECT keyword
+                    SELECT keyword, COUNT(*) OVER () AS total
                     FROM keywords
-                    WHERE keyword ILIKE '%' || $1 || '%'
+                    WHERE keyword_norm LIKE '%' || lower(translate($1, 'Ёё', 'Ее')) || '%'
                     ORDER BY keyword ASC
                         LIMIT $2 OFFSET $3;
                     """,
@@ -59,14 +182,6 @@ class Repo:
                     limit,
                     offset,
                 )
-                total = await conn.fetchval(
-                    """
-                    SELECT COUNT(*)
-                    FROM keywords
-                    WHERE keyword ILIKE '%' || $1 || '%';
-                    """,
-                    q,
-                )
             else:
                 rows = await conn.fetch(
                     """
@@ -78,14 +193,44 @@ class Repo:
                     limit,
                     offset,
                 )
-                total = await conn.fetchval("SELECT COUNT(*) FROM keywords;")
+                # Unfiltered total only feeds the pagination widget; the
+                # planner statistics estimate is O(1) where COUNT(*) (or the
+                # window variant) would walk the whole table.
+                estimate = await conn.fetchval(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = 'keywords';"
+                )
+                total = int(estimate or 0)
+                if total < offset + len(rows):
+                    # -1 / stale before the first (auto)analyze: count exactly.
+                    total = int(await conn.fetchval("SELECT COUNT(*) FROM keywords;"))
+                return [r[0] for r in rows], total
+
+            if rows:
+                total = int(rows[0][1])
+            elif offset > 0:
+                # Page past the end: the window total is not available, so fall
+                # back to a plain count for a correct pagination widget.
+                total = int(
+                    await conn.fetchval(
+                        """
+                        SELECT COUNT(*)
+                        FROM keywords
+                        WHERE keyword_norm LIKE '%' || lower(translate($1, 'Ёё', 'Ее')) || '%';
+                        """,
+                        q,
+                    )
+                )
+            else:
+                total = 0
 
-        return [r["keyword"] for r in rows], int(total)
+        return [r[0] for r in rows], total
 
     async def keyword_all(self) -> list[str]:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             rows = await conn.fetch("SELECT keyword FROM keywords ORDER BY keyword ASC;")
-            return [r["keyword"] for r in rows]
+            # Positional access is a direct C-level index into the Record,
+            # skipping the per-row column-name hash lookup.
+            return [r[0] for r in rows]
 
     # ----------------------------
     # Forwarded messages (idempotency skeleton; will be used later)
@@ -102,59 +247,36 @@ class Repo:
         - If exists as sent -> cannot claim.
         - If exists as pending and not expired -> cannot claim.
         - If pending expired -> re-claim (update updated_at).
-        """
-        now = datetime.now(timezone.utc)
-        timeout = now - timedelta(seconds=pending_timeout_seconds)
-
-        async with self._pool.acquire() as conn:
-            async with conn.transaction():
-                row = await conn.fetchrow(
-                    """
-                    SELECT status, updated_at
-                    FROM forwarded_messages
-                    WHERE source_chat_id = $1 AND source_message_id = $2
-                        FOR UPDATE;
-                    """,
-                    source_chat_id,
-                    source_message_id,
-                )
-
-                if row is None:
-                    await conn.execute(
-                        """
-                        INSERT INTO forwarded_messages(source_chat_id, source_message_id, status, created_at, updated_at)
-                        VALUES ($1, $2, 'pending', $3, $3);
-                        """,
-                        source_chat_id,
-                        source_message_id,
-                        now,
-                    )
-                    return True
 
-                status = row["status"]
-                updated_at = row["updated_at"]
-
-                if status == "sent":
-                    return False
-
-                if status == "pending" and updated_at is not None and updated_at > timeout:
-                    return False
-
-                await conn.execute(
-                    """
-                    UPDATE forwarded_messages
-                    SET status = 'pending', updated_at = $3
-                    WHERE source_chat_id = $1 AND source_message_id = $2;
-                    """,
-                    source_chat_id,
-                    source_message_id,
-                    now,
-                )
-                return True
+        One atomic upsert: the ON CONFLICT WHERE clause encodes the claim
+        rules, so there is no SELECT ... FOR UPDATE, no explicit transaction
+        and no row-lock window between check and write. A returned row means
+        the caller won the claim. All timestamps and the expiry cutoff come
+        from the server clock, so pending expiry cannot drift with skew
+        between app and database hosts.
+        """
+        async with self._acquire() as conn:
+            claimed = await conn.fetchval(
+                """
+                INSERT INTO forwarded_messages(source_chat_id, source_message_id, status, created_at, updated_at)
+                VALUES ($1, $2, 'pending', NOW(), NOW())
+                    ON CONFLICT (source_chat_id, source_message_id)
+                DO UPDATE SET status = 'pending', updated_at = NOW()
+                WHERE forwarded_messages.status <> 'sent'
+                  AND (forwarded_messages.status <> 'pending'
+                       OR forwarded_messages.updated_at IS NULL
+                       OR forwarded_messages.updated_at <= NOW() - make_interval(secs => $3))
+                RETURNING TRUE;
+                """,
+                source_chat_id,
+                source_message_id,
+                pending_timeout_seconds,
+            )
+            return claimed is not None
 
     async def forwarded_mark_sent(self, source_chat_id: int, source_message_id: int) -> None:
-        now = datetime.now(timezone.utc)
-        async with self._pool.acquire() as conn:
+        now = _utc_now()
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 UPDATE forwarded_messages
@@ -167,8 +289,8 @@ class Repo:
             )
 
     async def forwarded_mark_failed(self, source_chat_id: int, source_message_id: int, error: str) -> None:
-        now = datetime.now(timezone.utc)
-        async with self._pool.acquire() as conn:
+        now = _utc_now()
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 UPDATE forwarded_messages
@@ -177,7 +299,7 @@ class Repo:
                 """,
                 source_chat_id,
                 source_message_id,
-                error,
+                _truncate_utf8(error),
                 now,
             )
 
@@ -185,7 +307,7 @@ class Repo:
     # Channel checkpoint (skeleton; will be used later)
     # ----------------------------
     async def checkpoint_get(self, source_chat_id: int) -> tuple[int | None, datetime | None]:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             row = await conn.fetchrow(
                 """
                 SELECT last_message_id, last_message_date
@@ -196,10 +318,10 @@ class Repo:
             )
             if not row:
                 return None, None
-            return row["last_message_id"], row["last_message_date"]
+            return row[0], row[1]
 
     async def checkpoint_upsert(self, source_chat_id: int, last_message_id: int, last_message_date: datetime) -> None:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO channel_checkpoint(channel_id, last_message_id, last_message_date, updated_at)
@@ -213,25 +335,25 @@ class Repo:
                 source_chat_id,
                 last_message_id,
                 last_message_date,
-                datetime.now(timezone.utc),
+                _utc_now(),
             )
 
     # ----------------------------
     # Event log
     # ----------------------------
     async def event_error_add(self, message: str) -> None:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO event_log(status, level, message, created_at)
                 VALUES ('error', 'error', $1, $2);
                 """,
-                message,
-                datetime.now(timezone.utc),
+                _truncate_utf8(message),
+                _utc_now(),
             )
 
     async def event_error_latest(self, limit: int = 100) -> list[dict[str, Any]]:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             rows = await conn.fetch(
                 """
                 SELECT id, message, created_at
@@ -244,11 +366,14 @@ class Repo:
             )
             return [dict(r) for r in rows]
 
-    async def event_error_list(self, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
-        async with self._pool.acquire() as conn:
+    async def event_error_list(self, limit: int, offset: int) -> tuple[list[asyncpg.Record], int]:
+        # Records go straight to the template (Jinja falls back to item
+        # lookup), so no per-row dict is built; COALESCE saves the None
+        # branch at the call site.
+        async with self._acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT id, message, created_at
+                SELECT id, COALESCE(message, '') AS message, created_at
                 FROM event_log
                 WHERE level = 'error'
                 ORDER BY created_at DESC
@@ -264,16 +389,42 @@ class Repo:
                 WHERE level = 'error';
                 """
             )
-            return [dict(r) for r in rows], int(total)
+            return rows, int(total)
 
     # ----------------------------
     # Singleton tables: bot_state / app_status
     # ----------------------------
+    async def bot_state_listen(self, callback) -> None:
+        """
+        Holds a dedicated pool connection LISTENing on bot_state_changed
+        (fired by the 0015 trigger). The callback gets asyncpg's
+        (connection, pid, channel, payload) arguments.
+        """
+        if self._listen_conn is not None:
+            return
+        self._listen_conn = await self._pool.acquire()
+        await self._listen_conn.add_listener("bot_state_changed", callback)
+
+    async def bot_state_unlisten(self, callback) -> None:
+        if self._listen_conn is None:
+            return
+        try:
+            await self._listen_conn.remove_listener("bot_state_changed", callback)
+        finally:
+            await self._pool.release(self._listen_conn)
+            self._listen_conn = None
+
     async def bot_state_get(self) -> BotState:
-        async with self._pool.acquire() as conn:
+        now = time.monotonic()
+        if (
+            self._bot_state_cache is not None
+            and now - self._bot_state_cache_at < self.SINGLETON_CACHE_TTL_SECONDS
+        ):
+            return self._bot_state_cache
+        async with self._acquire() as conn:
             row = await conn.fetchrow(
                 """
-                SELECT enabled, restart_requested_at
+                SELECT enabled, restart_requested_at, version
                 FROM bot_state
                 WHERE id = 1;
                 """
@@ -282,37 +433,60 @@ class Repo:
                 await conn.execute(
                     "INSERT INTO bot_state(id, enabled, restart_requested_at) VALUES (1, false, NULL) ON CONFLICT (id) DO NOTHING;"
                 )
-                return BotState(enabled=False, restart_requested_at=None)
+                state = BotState(enabled=False, restart_requested_at=None)
+            else:
+                state = BotState(
+                    enabled=bool(row[0]),
+                    restart_requested_at=row[1],
+                    version=int(row[2]),
+                )
+        self._bot_state_cache = state
+        self._bot_state_cache_at = now
+        return state
 
-            return BotState(enabled=bool(row["enabled"]), restart_requested_at=row["restart_requested_at"])
+    async def bot_state_get_version(self) -> int:
+        """Cheap change check: a single int read instead of the full row."""
+        async with self._acquire() as conn:
+            version = await conn.fetchval("SELECT version FROM bot_state WHERE id = 1;")
+            return int(version or 0)
 
     async def bot_state_set_enabled(self, enabled: bool) -> None:
-        async with self._pool.acquire() as conn:
+        self._bot_state_cache = None
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO bot_state(id, enabled, restart_requested_at)
                 VALUES (1, $1, NULL)
                     ON CONFLICT (id)
-                DO UPDATE SET enabled = EXCLUDED.enabled;
+                DO UPDATE SET enabled = EXCLUDED.enabled,
+                              version = bot_state.version + 1;
                 """,
                 enabled,
             )
 
     async def bot_state_request_restart(self) -> None:
-        now = datetime.now(timezone.utc)
-        async with self._pool.acquire() as conn:
+        self._bot_state_cache = None
+        now = _utc_now()
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO bot_state(id, enabled, restart_requested_at)
                 VALUES (1, true, $1)
                     ON CONFLICT (id)
-                DO UPDATE SET restart_requested_at = EXCLUDED.restart_requested_at;
+                DO UPDATE SET restart_requested_at = EXCLUDED.restart_requested_at,
+                              version = bot_state.version + 1;
                 """,
                 now,
             )
 
     async def app_status_get(self) -> AppStatus:
-        async with self._pool.acquire() as conn:
+        now = time.monotonic()
+        if (
+            self._app_status_cache is not None
+            and now - self._app_status_cache_at < self.SINGLETON_CACHE_TTL_SECONDS
+        ):
+            return self._app_status_cache
+        async with self._acquire() as conn:
             row = await conn.fetchrow(
                 """
                 SELECT connected, last_error, last_event_time, last_event_message
@@ -328,22 +502,67 @@ class Repo:
                         ON CONFLICT (id) DO NOTHING;
                     """
                 )
-                return AppStatus(
+                status = AppStatus(
                     connected=False,
                     last_error=None,
                     last_event_time=None,
                     last_event_message=None,
                 )
-
-            return AppStatus(
-                connected=bool(row["connected"]),
-                last_error=row["last_error"],
-                last_event_time=row["last_event_time"],
-                last_event_message=row["last_event_message"],
+            else:
+                status = AppStatus(
+                    connected=bool(row[0]),
+                    last_error=row[1],
+                    last_event_time=row[2],
+                    last_event_message=row[3],
+                )
+        self._app_status_cache = status
+        self._app_status_cache_at = now
+        return status
+
+    async def dashboard_bundle(
+        self, target_default: str | None = None
+    ) -> tuple[str | None, BotState, AppStatus]:
+        """Everything the dashboard shows in one round trip: the singleton
+        bot_state and app_status rows plus the target_channel setting.
+        LEFT JOINs off a one-row anchor tolerate rows that do not exist yet
+        (NULLs fold to the same defaults the individual getters use), and
+        both singleton caches are refreshed from the result."""
+        now = time.monotonic()
+        async with self._acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT s.value,
+                       bs.enabled, bs.restart_requested_at, bs.version,
+                       st.connected, st.last_error, st.last_event_time, st.last_event_message
+                FROM (SELECT 1) AS one
+                         LEFT JOIN app_settings s ON s.key = 'target_channel'
+                         LEFT JOIN bot_state bs ON bs.id = 1
+                         LEFT JOIN app_status st ON st.id = 1;
+                """
             )
+        raw_target = str(row[0]) if row[0] is not None else None
+        self._setting_cache["target_channel"] = (now, raw_target)
+        target = raw_target if raw_target is not None else target_default
+        state = BotState(
+            enabled=bool(row[1]),
+            restart_requested_at=row[2],
+            version=int(row[3] or 0),
+        )
+        status = AppStatus(
+            connected=bool(row[4]),
+            last_error=row[5],
+            last_event_time=row[6],
+            last_event_message=row[7],
+        )
+        self._bot_state_cache = state
+        self._bot_state_cache_at = now
+        self._app_status_cache = status
+        self._app_status_cache_at = now
+        return target, state, status
 
     async def app_status_set_connected(self, connected: bool) -> None:
-        async with self._pool.acquire() as conn:
+        self._app_status_cache = None
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO app_status(id, connected, last_error, last_event_time, last_event_message)
@@ -355,8 +574,34 @@ class Repo:
                 connected,
             )
 
+    async def app_status_flush(self, connected: bool | None, error: str | None) -> None:
+        """
+        Coalesced status write: applies connected and/or last_error in a single
+        statement. A None argument leaves that field untouched; writing
+        connected without an error clears last_error, matching the separate
+        app_status_set_connected behavior.
+        """
+        self._app_status_cache = None
+        async with self._acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO app_status(id, connected, last_error, last_event_time, last_event_message)
+                VALUES (1, COALESCE($1, false), $2, NULL, NULL)
+                    ON CONFLICT (id)
+                DO UPDATE SET connected = COALESCE($1, app_status.connected),
+                              last_error = CASE
+                                  WHEN $2 IS NOT NULL THEN $2
+                                  WHEN $1 IS NOT NULL THEN NULL
+                                  ELSE app_status.last_error
+                              END;
+                """,
+                connected,
+                _truncate_utf8(error) if error is not None else None,
+            )
+
     async def app_status_set_error(self, error: str) -> None:
-        async with self._pool.acquire() as conn:
+        self._app_status_cache = None
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO app_status(id, connected, last_error, last_event_time, last_event_message)
@@ -364,12 +609,13 @@ class Repo:
                     ON CONFLICT (id)
                 DO UPDATE SET last_error = EXCLUDED.last_error;
                 """,
-                error,
+                _truncate_utf8(error),
             )
 
     async def app_status_set_event(self, message: str) -> None:
-        now = datetime.now(timezone.utc)
-        async with self._pool.acquire() as conn:
+        self._app_status_cache = None
+        now = _utc_now()
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO app_status(id, connected, last_error, last_event_time, last_event_message)
@@ -379,51 +625,84 @@ class Repo:
                                            last_event_message = EXCLUDED.last_event_message;
                 """,
                 now,
-                message,
+                _truncate_utf8(message),
             )
 
     # ----------------------------
     # Cleanup
     # ----------------------------
     async def cleanup(self) -> dict[str, int]:
-        now = datetime.now(timezone.utc)
-        log_cutoff = now - timedelta(days=7)
-        forwards_cutoff = now - timedelta(days=30)
-
-        async with self._pool.acquire() as conn:
-            deleted_logs = await conn.execute(
-                "DELETE FROM event_log WHERE created_at < $1;",
-                log_cutoff,
-            )
-            deleted_forwards = await conn.execute(
-                "DELETE FROM forwarded_messages WHERE created_at < $1;",
-                forwards_cutoff,
-            )
+        """Runs the retention deletes and records the "Cleanup done" status
+        event on the same connection in one transaction, so the whole
+        operation is a single pool checkout and the event never reports
+        counts from a partially failed run."""
+        self._app_status_cache = None
+        # asyncpg binds timedelta as a native interval; the cutoff is computed
+        # on the server clock, consistent with the claim timestamps.
+        async with self._acquire() as conn:
+            async with conn.transaction():
+                deleted_logs = await conn.execute(
+                    "DELETE FROM event_log WHERE created_at < NOW() - $1::interval;",
+                    timedelta(days=7),
+                )
+                deleted_forwards = await conn.execute(
+                    "DELETE FROM forwarded_messages WHERE created_at < NOW() - $1::interval;",
+                    timedelta(days=30),
+                )
 
-        # asyncpg returns "DELETE <n>"
-        def _count(cmd: str) -> int:
-            try:
-                return int(cmd.split()[-1])
-            except Exception:
-                return 0
+                # asyncpg returns "DELETE <n>"
+                def _count(cmd: str) -> int:
+                    try:
+                        return int(cmd.split()[-1])
+                    except Exception:
+                        return 0
+
+                result = {
+                    "event_log": _count(deleted_logs),
+                    "forwarded_messages": _count(deleted_forwards),
+                }
+                await conn.execute(
+                    """
+                    INSERT INTO app_status(id, connected, last_error, last_event_time, last_event_message)
+                    VALUES (1, false, NULL, $1, $2)
+                        ON CONFLICT (id)
+                    DO UPDATE SET last_event_time = EXCLUDED.last_event_time,
+                                  last_event_message = EXCLUDED.last_event_message;
+                    """,
+                    _utc_now(),
+                    _truncate_utf8(
+                        f"Cleanup done: event_log={result['event_log']}, "
+                        f"forwarded_messages={result['forwarded_messages']}"
+                    ),
+                )
 
-        return {"event_log": _count(deleted_logs), "forwarded_messages": _count(deleted_forwards)}
+        return result
 
     # ----------------------------
     # Settings
     # ----------------------------
     async def app_setting_get(self, key: str, default: str | None = None) -> str | None:
-        async with self._pool.acquire() as conn:
-            value = await conn.fetchval(
-                "SELECT value FROM app_settings WHERE key = $1;",
-                key,
-            )
-            if value is None:
-                return default
-            return str(value)
+        # Settings change only through app_setting_set in this process, which
+        # writes through the cache, so the TTL just bounds staleness against
+        # out-of-band edits to the table.
+        cached = self._setting_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.SETTING_CACHE_TTL_SECONDS:
+            value = cached[1]
+        else:
+            async with self._acquire() as conn:
+                value = await conn.fetchval(
+                    "SELECT value FROM app_settings WHERE key = $1;",
+                    key,
+                )
+            value = str(value) if value is not None else None
+            self._setting_cache[key] = (now, value)
+        if value is None:
+            return default
+        return value
 
     async def app_setting_set(self, key: str, value: str) -> None:
-        async with self._pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO app_settings(key, value, updated_at)
@@ -434,5 +713,6 @@ class Repo:
                 """,
                 key,
                 value,
-                datetime.now(timezone.utc),
+                _utc_now(),
             )
+        self._setting_cache[key] = (time.monotonic(), value)
@@ -1,15 +1,22 @@
 import asyncio
+import json
 import os
-from datetime import datetime, timezone
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Final
+
 from app.bot.runtime import BotRuntime
 
 import asyncpg
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from app.db.migrate import apply_migrations, get_database_url_from_env
 from app.db.repo import Repo
+from app.web.deps import RedirectToLogin, login_redirect
+from app.web.templating import TEMPLATES_DIR, precompile_all
 from app.web.routes_auth import router as auth_router
 from app.web.routes_controls import router as controls_router
 from app.web.routes_dashboard import router as dashboard_router
@@ -27,57 +34,90 @@ def require_dir(path: str) -> None:
         raise RuntimeError(f"Required directory not found: {path}")
 
 
-app = FastAPI(title="tg-keyword-watcher", docs_url="/api-docs", redoc_url=None)
-
-PROJECT_ROOT = "/app"
-APP_DIR = os.path.join(PROJECT_ROOT, "app")
-
-TEMPLATES_DIR = os.path.join(APP_DIR, "web", "templates")
-STATIC_DIR = os.path.join(APP_DIR, "web", "static")
+# Derived from the module location rather than a hardcoded image path, so the
+# app also runs outside the Docker WORKDIR (local dev, tests).
+APP_DIR: Final[str] = str(Path(__file__).resolve().parent)
+STATIC_DIR: Final[str] = os.path.join(APP_DIR, "web", "static")
 
 require_dir(TEMPLATES_DIR)
 require_dir(STATIC_DIR)
 
-templates = Jinja2Templates(directory=TEMPLATES_DIR)
-templates.env.globals["app_name"] = os.getenv("APP_NAME", "tg-keyword-watcher")
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
-# Routes
-app.include_router(auth_router)
-app.include_router(dashboard_router)
-app.include_router(controls_router)
-app.include_router(keywords_router)
-app.include_router(logs_router)
-app.include_router(docs_router)
+async def _warmup_pool(pool: asyncpg.Pool) -> None:
+    """Opens and pings the minimum connections concurrently so the first
+    requests never pay the TCP+auth connect cost."""
+    conns = await asyncio.gather(*(pool.acquire() for _ in range(pool.get_min_size())))
+    try:
+        await asyncio.gather(*(conn.fetchval("SELECT 1;") for conn in conns))
+    finally:
+        for conn in conns:
+            await pool.release(conn)
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Compile every template up front so no request pays for the first render.
+    precompile_all()
+
     db_url = get_database_url_from_env()
 
     # Apply SQL migrations on startup (explicit, no Alembic).
     await apply_migrations(db_url)
 
     # Create DB pool and repository.
-    pool = await asyncpg.create_pool(dsn=db_url, min_size=1, max_size=10)
+    # asyncpg transparently prepares and caches statements per connection
+    # (keyed by query text); size the cache to hold every Repo query so hot
+    # statements skip parse/plan after first use.
+    # jit=off skips Postgres JIT warmup, which never pays off for the short
+    # queries this app runs; application_name makes the pool visible in
+    # pg_stat_activity; idle connections are recycled after 5 minutes.
+    # Pool bounds are deploy-specific (shared Postgres vs dedicated container),
+    # so they come from env; min == max keeps the pool hot with no connect
+    # ramp-up on load spikes, at the cost of a few idle connections.
+    pool_max = int(os.getenv("DB_POOL_MAX_SIZE", "10").strip() or "10")
+    pool_min = int(os.getenv("DB_POOL_MIN_SIZE", "").strip() or str(min(2, pool_max)))
+    pool = await asyncpg.create_pool(
+        dsn=db_url,
+        min_size=pool_min,
+        max_size=pool_max,
+        statement_cache_size=256,
+        max_inactive_connection_lifetime=300.0,
+        command_timeout=10.0,
+        server_settings={"jit": "off", "application_name": "tg-keyword-watcher"},
+    )
+    await _warmup_pool(pool)
     app.state.db_pool = pool
     app.state.repo = Repo(pool)
     app.state.bot_runtime = BotRuntime(app.state.repo)
     await app.state.bot_runtime.start()
     app.state.cleanup_task = asyncio.create_task(_cleanup_loop(app.state.repo))
 
+    yield
+
+    # Teardown order matters: the runtime and cleanup task still write status
+    # rows while stopping, so the pool must close last.
+    app.state.cleanup_task.cancel()
+    await app.state.bot_runtime.stop()
+    await pool.close()
+
 
-@app.on_event("shutdown")
-async def on_shutdown() -> None:
-    pool = getattr(app.state, "db_pool", None)
-    if pool is not None:
-        await pool.close()
-    runtime = getattr(app.state, "bot_runtime", None)
-    if runtime is not None:
-        await runtime.stop()
-    cleanup_task = getattr(app.state, "cleanup_task", None)
-    if cleanup_task is not None:
-        cleanup_task.cancel()
+app = FastAPI(title="tg-keyword-watcher", docs_url="/api-docs", redoc_url=None, lifespan=lifespan)
+
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+
+@app.exception_handler(RedirectToLogin)
+async def _on_redirect_to_login(request, exc: RedirectToLogin):
+    return login_redirect(next_path=exc.next_path)
+
+
+# Routes
+app.include_router(auth_router)
+app.include_router(dashboard_router)
+app.include_router(controls_router)
+app.include_router(keywords_router)
+app.include_router(logs_router)
+app.include_router(docs_router)
 
 
 async def _cleanup_loop(repo: Repo) -> None:
@@ -85,17 +125,41 @@ async def _cleanup_loop(repo: Repo) -> None:
         now = datetime.now(timezone.utc)
         next_run = now.replace(hour=3, minute=0, second=0, microsecond=0)
         if next_run <= now:
-            next_run = next_run.replace(day=next_run.day + 1)
+            # timedelta rolls over month/year boundaries; the old
+            # replace(day=day + 1) raised ValueError on the last day of the
+            # month and silently killed this task.
+            next_run += timedelta(days=1)
         sleep_seconds = max(1, int((next_run - now).total_seconds()))
         await asyncio.sleep(sleep_seconds)
 
-        result = await repo.cleanup()
-        await repo.app_status_set_event(
-            f"Cleanup done: event_log={result.get('event_log', 0)}, "
-            f"forwarded_messages={result.get('forwarded_messages', 0)}"
-        )
+        try:
+            # cleanup() also records the "Cleanup done" status event, in the
+            # same transaction as the deletes.
+            await repo.cleanup()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # A failed run must not end the loop: unbounded event_log /
+            # forwarded_messages growth slows every other query.
+            try:
+                await repo.app_status_set_error(f"Cleanup failed: {exc}")
+                await repo.event_error_add(f"Cleanup failed: {exc}")
+            except Exception:
+                pass
+
+
+# Liveness probes hit /health several times a second across instances; the
+# body only changes once per second, so serialize it at most that often and
+# return the cached bytes directly, skipping response-model inference and
+# json.dumps on every probe.
+_health_cache: list = [0.0, b""]
 
 
 @app.get("/health")
-async def health() -> dict:
-    return {"status": "ok", "time_utc": utc_now_iso()}
+async def health() -> Response:
+    now = time.time()
+    if now - _health_cache[0] >= 1.0:
+        body = json.dumps({"status": "ok", "time_utc": utc_now_iso()}).encode("ascii")
+        _health_cache[0] = now
+        _health_cache[1] = body
+    return Response(content=_health_cache[1], media_type="application/json")
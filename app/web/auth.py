@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta, timezone
 
 from fastapi import Request, Response
-from itsdangerous import BadSignature, URLSafeTimedSerializer
 
 
 def _get_secret() -> str:
@@ -15,14 +18,31 @@ def _get_secret() -> str:
     return secret
 
 
-def _serializer() -> URLSafeTimedSerializer:
-    return URLSafeTimedSerializer(_get_secret(), salt="tgmon-auth-v1")
-
-
 COOKIE_NAME = "tgmon_session"
 COOKIE_MAX_AGE_SECONDS = 60 * 60 * 24 * 7  # 7 days
 
+# Domain-separation context for the session tag (kept from the old
+# itsdangerous salt so the purpose of the key stays explicit).
+_TOKEN_CONTEXT = b"tgmon-auth-v1"
+
+
+@functools.lru_cache(maxsize=1)
+def _session_token() -> str:
+    """
+    The session payload carries a single bit ("logged in"), so the cookie is
+    just a keyed BLAKE2b tag over a fixed context: no JSON, no base64d payload,
+    and verification is one constant-time compare. Expiry is enforced by the
+    cookie max_age; rotation happens via APP_SECRET_KEY, same as before.
+    """
+    tag = hashlib.blake2b(
+        _TOKEN_CONTEXT,
+        key=_get_secret().encode("utf-8"),
+        digest_size=16,
+    ).digest()
+    return base64.urlsafe_b64encode(tag).decode("ascii")
+
 
+@functools.lru_cache(maxsize=1)
 def _admin_creds() -> tuple[str, str]:
     login = os.getenv("ADMIN_LOGIN", "").strip()
     password = os.getenv("ADMIN_PASSWORD", "").strip()
@@ -33,15 +53,21 @@ def _admin_creds() -> tuple[str, str]:
 
 def verify_credentials(login: str, password: str) -> bool:
     expected_login, expected_password = _admin_creds()
-    return login == expected_login and password == expected_password
+    # compare_digest is constant-time; & (not `and`) forces both comparisons
+    # to run so the login check leaks no timing signal either. Compared as
+    # bytes: compare_digest rejects str arguments with non-ASCII characters,
+    # and Cyrillic credentials are valid input here.
+    return hmac.compare_digest(
+        login.encode("utf-8"), expected_login.encode("utf-8")
+    ) & hmac.compare_digest(
+        password.encode("utf-8"), expected_password.encode("utf-8")
+    )
 
 
 def set_logged_in(response: Response) -> None:
-    s = _serializer()
-    token = s.dumps({"v": 1, "logged_in": True})
     response.set_cookie(
         COOKIE_NAME,
-        token,
+        _session_token(),
         max_age=COOKIE_MAX_AGE_SECONDS,
         httponly=True,
         samesite="lax",
@@ -58,16 +84,12 @@ def is_logged_in(request: Request) -> bool:
     token = request.cookies.get(COOKIE_NAME)
     if not token:
         return False
-
-    s = _serializer()
-    try:
-        data = s.loads(token, max_age=COOKIE_MAX_AGE_SECONDS)
-    except BadSignature:
-        return False
-
-    return bool(data.get("logged_in") is True)
+    # Compared as bytes: compare_digest rejects non-ASCII str input, and the
+    # cookie value is attacker-controlled — a garbage cookie must read as
+    # "not logged in", not a TypeError.
+    return hmac.compare_digest(token.encode("utf-8"), _session_token().encode("ascii"))
 
 
 def login_expiry_utc() -> str:
     expires = datetime.now(timezone.utc) + timedelta(seconds=COOKIE_MAX_AGE_SECONDS)
-    return expires.isoformat()
\ No newline at end of file
+    return expires.isoformat()
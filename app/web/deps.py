@@ -1,19 +1,57 @@
+from functools import lru_cache
+from urllib.parse import parse_qsl, quote_plus
+
 from fastapi import Request
 from fastapi.responses import RedirectResponse
 
 from app.web.auth import is_logged_in
 
 
+class RedirectToLogin(Exception):
+    """Raised for unauthenticated page requests; converted to a 303 redirect
+    by the app-level exception handler registered in main.py."""
+
+    def __init__(self, next_path: str = "/") -> None:
+        super().__init__(next_path)
+        self.next_path = next_path
+
+
 def require_auth(request: Request) -> None:
+    """Route dependency: no-op for logged-in users, redirect otherwise.
+
+    GET requests come back to the page they asked for after login; POSTs
+    land on the dashboard, since replaying the form makes no sense.
+    """
     if is_logged_in(request):
         return
-    # Raise a redirect by returning a response from endpoints (see usage in routes).
-    raise RedirectToLogin()
+    raise RedirectToLogin(request.url.path if request.method == "GET" else "/")
 
 
-class RedirectToLogin(Exception):
-    pass
+# The response carries nothing per-request (no cookies), so one instance per
+# destination can be shared; the cache is bounded because next_path comes from
+# the request path.
+@lru_cache(maxsize=64)
+def login_redirect(next_path: str = "/") -> RedirectResponse:
+    return RedirectResponse(url=f"/login?next={next_path}", status_code=303)
 
 
-def login_redirect(next_path: str = "/") -> RedirectResponse:
-    return RedirectResponse(url=f"/login?next={next_path}", status_code=303)
\ No newline at end of file
+async def form_fields(request: Request) -> dict[str, str]:
+    """Parses the small urlencoded admin forms with parse_qsl instead of
+    Starlette's full form parser — several times cheaper for these sub-1KB
+    bodies. Anything else (multipart, odd content types) falls back to the
+    regular parser."""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        body = await request.body()
+        return dict(parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True))
+    form = await request.form()
+    return {k: v for k, v in form.items() if isinstance(v, str)}
+
+
+def query_string(params: dict[str, str]) -> str:
+    """Query string for redirect URLs. The keys are fixed ASCII names, so
+    only values need quoting; quote_plus is C-implemented and much cheaper
+    than urlencode for these one-to-three pair dicts."""
+    if not params:
+        return ""
+    return "?" + "&".join(f"{k}={quote_plus(v)}" for k, v in params.items())
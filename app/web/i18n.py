@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Callable
 from urllib.parse import urlencode
 
 from fastapi import Request
@@ -79,21 +81,62 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
 }
 
 
+# Flattened once at import: one flat dict per language with the default-lang
+# fallback already resolved, so a translation is a single dict lookup instead
+# of the nested get/fallback chain per call.
+LANG_TABLES: dict[str, dict[str, str]] = {
+    lang: {
+        key: data.get(lang) or data.get(DEFAULT_LANG) or key
+        for key, data in TRANSLATIONS.items()
+    }
+    for lang in SUPPORTED_LANGS
+}
+
+
 def t(key: str, lang: str) -> str:
-    data = TRANSLATIONS.get(key)
-    if not data:
-        return key
-    return data.get(lang, data.get(DEFAULT_LANG, key))
+    table = LANG_TABLES.get(lang)
+    if table is None:
+        table = LANG_TABLES[DEFAULT_LANG]
+    return table.get(key, key)
+
+
+def make_t(lang: str) -> Callable[[str], str]:
+    """
+    One-argument translator bound to a language, for template contexts:
+    Jinja calls it dozens of times per render, and the bound closure does a
+    single dict lookup per call. Unknown languages fold to the default
+    BEFORE the cache lookup — some call sites pass the raw form field, and
+    caching on that would grow without bound on junk input.
+    """
+    if lang not in LANG_TABLES:
+        lang = DEFAULT_LANG
+    return _make_t_cached(lang)
+
+
+@lru_cache(maxsize=None)
+def _make_t_cached(lang: str) -> Callable[[str], str]:
+    table = LANG_TABLES[lang]
+
+    def _t(key: str) -> str:
+        return table.get(key, key)
+
+    return _t
 
 
 def resolve_lang(request: Request) -> tuple[str, bool]:
-    query_lang = (request.query_params.get("lang") or "").lower().strip()
-    if query_lang in SUPPORTED_LANGS:
-        return query_lang, True
+    # Clean-up only runs when the value is present; the common request has
+    # neither a lang param nor needs normalizing, and this is on every render.
+    query_lang = request.query_params.get("lang")
+    if query_lang:
+        query_lang = query_lang.strip().lower()
+        if query_lang in SUPPORTED_LANGS:
+            return query_lang, True
 
-    cookie_lang = (request.cookies.get("lang") or "").lower().strip()
-    if cookie_lang in SUPPORTED_LANGS:
-        return cookie_lang, False
+    cookie_lang = request.cookies.get("lang")
+    if cookie_lang:
+        cookie_lang = cookie_lang.strip().lower()
+        if cookie_lang in SUPPORTED_LANGS:
+            return cookie_lang, False
 
     return DEFAULT_LANG, False
 
@@ -109,15 +152,42 @@ def apply_lang_cookie(response, lang: str, should_set: bool) -> None:
     )
 
 
-def build_lang_urls(request: Request) -> dict[str, str]:
-    base_path = request.url.path
-    params = dict(request.query_params)
-    params.pop("lang", None)
-
+@lru_cache(maxsize=256)
+def _build_lang_urls_cached(
+    base_path: str, other_params: tuple[tuple[str, str], ...]
+) -> dict[str, str]:
+    # The admin UI has a handful of paths and few distinct query combinations,
+    # so the switcher URLs repeat endlessly; urlencode (per-char quoting) is
+    # the dominant cost of building them, hence the memo.
     urls = {}
     for lang in SUPPORTED_LANGS:
-        params_with_lang = dict(params)
-        params_with_lang["lang"] = lang
-        query = urlencode(params_with_lang) if params_with_lang else ""
-        urls[lang] = f"{base_path}?{query}" if query else base_path
+        query = urlencode((*other_params, ("lang", lang)))
+        urls[lang] = f"{base_path}?{query}"
     return urls
+
+
+def build_lang_urls(request: Request) -> dict[str, str]:
+    base_path = request.url.path
+    other_params = tuple(
+        (k, v) for k, v in request.query_params.multi_items() if k != "lang"
+    )
+    return _build_lang_urls_cached(base_path, other_params)
+
+
+# The language-static part of every template context, built once per lang.
+_STATIC_CTX: dict[str, dict] = {
+    lang: {"lang": lang, "t": make_t(lang)} for lang in SUPPORTED_LANGS
+}
+
+
+def base_context(request: Request, lang: str) -> dict:
+    """Template context shared by every rendered page: the per-lang static
+    part merged (C-level dict union) with the per-request fields. Handlers
+    union their page-specific keys on top."""
+    static = _STATIC_CTX.get(lang)
+    if static is None:
+        static = _STATIC_CTX[DEFAULT_LANG]
+    return static | {
+        "request": request,
+        "lang_urls": build_lang_urls(request),
+    }
@@ -2,36 +2,21 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse, Response
-from fastapi.templating import Jinja2Templates
 
 from app.web.auth import login_expiry_utc, set_logged_in, verify_credentials, clear_login
-from app.web.i18n import apply_lang_cookie, build_lang_urls, resolve_lang, t
+from app.web.i18n import apply_lang_cookie, base_context, make_t, resolve_lang
+from app.web.templating import templates
 
 
 router = APIRouter()
 
 
-def _templates() -> Jinja2Templates:
-    # Import templates lazily to avoid circular imports.
-    from app.main import templates  # noqa: WPS433
-
-    return templates
-
-
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request, next: str = "/") -> HTMLResponse:
-    tpl = _templates()
     lang, set_cookie = resolve_lang(request)
-    resp = tpl.TemplateResponse(
+    resp = templates.TemplateResponse(
         "login.html",
-        {
-            "request": request,
-            "next": next,
-            "error": None,
-            "lang": lang,
-            "lang_urls": build_lang_urls(request),
-            "t": t,
-        },
+        base_context(request, lang) | {"next": next, "error": None},
     )
     apply_lang_cookie(resp, lang, set_cookie)
     return resp
@@ -44,21 +29,12 @@ async def login_action(
         password: str = Form(...),
         next: str = Form("/"),
 ) -> Response:
-    tpl = _templates()
-
     lang, set_cookie = resolve_lang(request)
 
     if not verify_credentials(login, password):
-        resp = tpl.TemplateResponse(
+        resp = templates.TemplateResponse(
             "login.html",
-            {
-                "request": request,
-                "next": next,
-                "error": t("login.error", lang),
-                "lang": lang,
-                "lang_urls": build_lang_urls(request),
-                "t": t,
-            },
+            base_context(request, lang) | {"next": next, "error": make_t(lang)("login.error")},
             status_code=401,
         )
         apply_lang_cookie(resp, lang, set_cookie)
@@ -1,86 +1,86 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from fastapi.responses import RedirectResponse
 
-from urllib.parse import urlencode
-
-from app.web.deps import RedirectToLogin, require_auth
-from app.web.i18n import t
+from app.web.deps import form_fields, query_string, require_auth
+from app.web.i18n import make_t
 
 
 router = APIRouter()
 
+# Every control action lands back on the dashboard. The response is immutable
+# (no cookies, no per-request headers) and Starlette only reads prebuilt
+# headers when sending, so one shared instance serves all requests without
+# rebuilding the header list each time. Handlers that schedule background
+# work must NOT return it: FastAPI attaches the per-request task list to the
+# returned response only while response.background is None, so a shared
+# instance would replay the first request's tasks forever.
+_TO_DASHBOARD = RedirectResponse(url="/", status_code=303)
+
 
-@router.post("/controls/enable")
-async def enable_bot(request: Request) -> RedirectResponse:
+async def _apply_state_write(app, write) -> None:
+    """Runs a deferred control write after the redirect has been sent and
+    wakes the bot loop once it committed. A failure cannot reach the operator
+    directly anymore, so it lands in app_status for the dashboard to show."""
     try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/", status_code=303)
+        await write()
+        app.state.bot_runtime.notify_state_changed()
+    except Exception as exc:
+        try:
+            await app.state.repo.app_status_set_error(f"Control write failed: {exc}")
+        except Exception:
+            pass
 
+
+@router.post("/controls/enable", dependencies=[Depends(require_auth)])
+async def enable_bot(request: Request, background_tasks: BackgroundTasks) -> RedirectResponse:
     repo = request.app.state.repo
-    await repo.bot_state_set_enabled(True)
+    background_tasks.add_task(
+        _apply_state_write, request.app, lambda: repo.bot_state_set_enabled(True)
+    )
     return RedirectResponse(url="/", status_code=303)
 
 
-@router.post("/controls/disable")
-async def disable_bot(request: Request) -> RedirectResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/", status_code=303)
-
+@router.post("/controls/disable", dependencies=[Depends(require_auth)])
+async def disable_bot(request: Request, background_tasks: BackgroundTasks) -> RedirectResponse:
     repo = request.app.state.repo
-    await repo.bot_state_set_enabled(False)
+    background_tasks.add_task(
+        _apply_state_write, request.app, lambda: repo.bot_state_set_enabled(False)
+    )
     return RedirectResponse(url="/", status_code=303)
 
 
-@router.post("/controls/restart")
-async def restart_bot(request: Request) -> RedirectResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/", status_code=303)
-
+@router.post("/controls/restart", dependencies=[Depends(require_auth)])
+async def restart_bot(request: Request, background_tasks: BackgroundTasks) -> RedirectResponse:
     repo = request.app.state.repo
-    await repo.bot_state_request_restart()
+    background_tasks.add_task(
+        _apply_state_write, request.app, repo.bot_state_request_restart
+    )
     return RedirectResponse(url="/", status_code=303)
 
 
-@router.post("/controls/cleanup")
+@router.post("/controls/cleanup", dependencies=[Depends(require_auth)])
 async def cleanup_data(request: Request) -> RedirectResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/", status_code=303)
-
     repo = request.app.state.repo
-    result = await repo.cleanup()
-    await repo.app_status_set_event(
-        f"Cleanup done: event_log={result.get('event_log', 0)}, "
-        f"forwarded_messages={result.get('forwarded_messages', 0)}"
-    )
-    return RedirectResponse(url="/", status_code=303)
+    await repo.cleanup()
+    return _TO_DASHBOARD
 
 
-@router.post("/controls/target-channel")
+@router.post("/controls/target-channel", dependencies=[Depends(require_auth)])
 async def update_target_channel(request: Request) -> RedirectResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/", status_code=303)
-
-    form = await request.form()
+    form = await form_fields(request)
     target = (form.get("target_channel") or "").strip()
     lang = (form.get("lang") or "").strip()
     if not target:
-        params = {"error": t("dashboard.target_error_empty", lang)}
+        params = {"error": make_t(lang)("dashboard.target_error_empty")}
         if lang:
             params["lang"] = lang
-        return RedirectResponse(url=f"/?{urlencode(params)}", status_code=303)
+        return RedirectResponse(url=f"/{query_string(params)}", status_code=303)
 
     repo = request.app.state.repo
     await repo.app_setting_set("target_channel", target)
     await repo.app_status_set_event(f'Target channel updated via UI: "{target}"')
-    return RedirectResponse(url=f"/?{urlencode({'lang': lang})}" if lang else "/", status_code=303)
+    if not lang:
+        return _TO_DASHBOARD
+    return RedirectResponse(url=f"/{query_string({'lang': lang})}", status_code=303)
@@ -1,60 +1,52 @@
 from __future__ import annotations
 
+import json
 import os
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 
-from app.web.deps import RedirectToLogin, require_auth
-from app.web.i18n import apply_lang_cookie, build_lang_urls, resolve_lang, t
+from app.web.auth import is_logged_in
+from app.web.deps import require_auth
+from app.web.i18n import apply_lang_cookie, base_context, resolve_lang
+from app.web.templating import templates
 
 
 router = APIRouter()
 
+# (state snapshot, serialized body) for /api/status.
+_status_cache: list = [None, b""]
 
-def _templates() -> Jinja2Templates:
-    from app.main import templates  # noqa: WPS433
+_UTC = timezone.utc
 
-    return templates
+# Env is fixed for the process lifetime; read once instead of per render.
+_TARGET_CHANNEL_DEFAULT = os.getenv("TARGET_CHANNEL", "")
+_SESSION_NAME = os.getenv("SESSION_NAME", "")
 
 
-@router.get("/", response_class=HTMLResponse)
+@router.get("/", response_class=HTMLResponse, dependencies=[Depends(require_auth)])
 async def dashboard(request: Request) -> HTMLResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        from app.web.deps import login_redirect
-
-        return login_redirect(next_path="/")
-
     lang, set_cookie = resolve_lang(request)
     repo = request.app.state.repo
-    env_target = os.getenv("TARGET_CHANNEL", "")
-    target_channel = (await repo.app_setting_get("target_channel", env_target) or "").strip()
     error = (request.query_params.get("error") or "").strip()
-    bot_state = await repo.bot_state_get()
-    app_status = await repo.app_status_get()
+    # Single round trip for all three reads.
+    target_raw, bot_state, app_status = await repo.dashboard_bundle(_TARGET_CHANNEL_DEFAULT)
+    target_channel = (target_raw or "").strip()
 
-    tpl = _templates()
-    resp = tpl.TemplateResponse(
+    resp = templates.TemplateResponse(
         "dashboard.html",
-        {
-            "request": request,
+        base_context(request, lang) | {
             "nav_active": "dashboard",
-            "lang": lang,
-            "lang_urls": build_lang_urls(request),
-            "t": t,
             "target_channel": target_channel,
-            "session_name": os.getenv("SESSION_NAME", ""),
+            "session_name": _SESSION_NAME,
             "error": error,
             "connected": bool(app_status.connected),
             "bot_enabled": bool(bot_state.enabled),
             "last_error": app_status.last_error or "",
-            "last_event_time": app_status.last_event_time.isoformat() if app_status.last_event_time else "",
+            "last_event_time": app_status.last_event_time.isoformat(timespec="seconds") if app_status.last_event_time else "",
             "last_event_message": app_status.last_event_message or "",
-            "server_time_utc": datetime.now(timezone.utc).isoformat(),
+            "server_time_utc": datetime.now(_UTC).isoformat(timespec="seconds"),
         },
     )
     apply_lang_cookie(resp, lang, set_cookie)
@@ -62,21 +54,27 @@ async def dashboard(request: Request) -> HTMLResponse:
 
 
 @router.get("/api/status", response_class=JSONResponse)
-async def dashboard_status(request: Request) -> JSONResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
+async def dashboard_status(request: Request) -> Response:
+    # API clients get a 401 body, not the login redirect the dependency does.
+    if not is_logged_in(request):
         return JSONResponse({"error": "unauthorized"}, status_code=401)
 
     repo = request.app.state.repo
-    bot_state = await repo.bot_state_get()
-    app_status = await repo.app_status_get()
-    return JSONResponse(
-        {
-            "connected": bool(app_status.connected),
-            "bot_enabled": bool(bot_state.enabled),
-            "last_error": app_status.last_error or "",
-            "last_event_time": app_status.last_event_time.isoformat() if app_status.last_event_time else "",
-            "last_event_message": app_status.last_event_message or "",
-        }
-    )
+    _, bot_state, app_status = await repo.dashboard_bundle()
+    # Polls mostly see unchanged state; re-serialize only when the snapshot
+    # differs (both dataclasses are frozen, so the pair is the cache key) and
+    # hand the cached bytes back otherwise.
+    key = (bot_state, app_status)
+    if key != _status_cache[0]:
+        body = json.dumps(
+            {
+                "connected": bool(app_status.connected),
+                "bot_enabled": bool(bot_state.enabled),
+                "last_error": app_status.last_error or "",
+                "last_event_time": app_status.last_event_time.isoformat(timespec="seconds") if app_status.last_event_time else "",
+                "last_event_message": app_status.last_event_message or "",
+            }
+        ).encode("utf-8")
+        _status_cache[0] = key
+        _status_cache[1] = body
+    return Response(content=_status_cache[1], media_type="application/json")
@@ -1,36 +1,54 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+import os
+
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import HTMLResponse
 
-from app.web.deps import RedirectToLogin, require_auth
-from app.web.i18n import apply_lang_cookie, build_lang_urls, resolve_lang, t
+from app.web.deps import require_auth
+from app.web.i18n import apply_lang_cookie, base_context, resolve_lang
+from app.web.templating import TEMPLATES_DIR, templates
 
 
 router = APIRouter()
 
-
-@router.get("/docs", response_class=HTMLResponse)
-async def docs_page(request: Request) -> HTMLResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        from app.web.deps import login_redirect
-
-        return login_redirect(next_path="/docs")
-
+# The docs page depends only on the language and the template sources, both
+# fixed for the lifetime of the image, so a validator keyed on template mtime
+# lets browsers revalidate with a 304 instead of a full render. base.html is
+# included because the page extends it.
+_TPL_VERSION = max(
+    int(os.path.getmtime(os.path.join(TEMPLATES_DIR, name)))
+    for name in ("docs.html", "base.html")
+)
+
+# Rendered bytes keyed by (lang, query string): the output depends only on
+# the language and the switcher URLs (which embed the query). No template
+# reads `request`, so rendering straight from the environment is safe. The
+# size cap guards against unbounded junk query strings.
+_page_cache: dict[tuple[str, str], bytes] = {}
+_PAGE_CACHE_MAX = 64
+
+
+@router.get("/docs", response_class=HTMLResponse, dependencies=[Depends(require_auth)])
+async def docs_page(request: Request) -> Response:
     lang, set_cookie = resolve_lang(request)
-    from app.main import templates  # noqa: WPS433
-
-    resp = templates.TemplateResponse(
-        "docs.html",
-        {
-            "request": request,
-            "nav_active": "docs",
-            "lang": lang,
-            "lang_urls": build_lang_urls(request),
-            "t": t,
-        },
-    )
+    etag = f'W/"docs-{lang}-{_TPL_VERSION}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    key = (lang, request.url.query)
+    body = _page_cache.get(key)
+    if body is None:
+        body = (
+            templates.get_template("docs.html")
+            .render(base_context(request, lang) | {"nav_active": "docs"})
+            .encode("utf-8")
+        )
+        if len(_page_cache) < _PAGE_CACHE_MAX:
+            _page_cache[key] = body
+
+    resp = HTMLResponse(body)
+    resp.headers["ETag"] = etag
+    resp.headers["Cache-Control"] = "private, max-age=300"
     apply_lang_cookie(resp, lang, set_cookie)
     return resp
@@ -1,26 +1,18 @@
 from __future__ import annotations
 
-from urllib.parse import urlencode
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-
-from app.web.deps import RedirectToLogin, require_auth
-from app.web.i18n import apply_lang_cookie, build_lang_urls, resolve_lang, t
+from app.web.deps import form_fields, query_string, require_auth
+from app.web.i18n import apply_lang_cookie, base_context, make_t, resolve_lang
+from app.web.templating import templates
 
 
 router = APIRouter()
 
 
-@router.get("/keywords", response_class=HTMLResponse)
-async def keywords_page(request: Request) -> HTMLResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        from app.web.deps import login_redirect
-
-        return login_redirect(next_path="/keywords")
-
+@router.get("/keywords", response_class=HTMLResponse, dependencies=[Depends(require_auth)])
+async def keywords_page(request: Request) -> Response:
     lang, set_cookie = resolve_lang(request)
     repo = request.app.state.repo
     q = (request.query_params.get("q") or "").strip()
@@ -36,20 +28,17 @@ async def keywords_page(request: Request) -> HTMLResponse:
     keywords, total = await repo.keyword_list(q=q, limit=limit, offset=offset)
     total_pages = max(1, (total + limit - 1) // limit)
     if page > total_pages:
-        page = total_pages
-        offset = (page - 1) * limit
-        keywords, total = await repo.keyword_list(q=q, limit=limit, offset=offset)
-
-    from app.main import templates  # noqa: WPS433
+        # Past-the-end page: one redirect hop to the last page instead of a
+        # second pair of queries on this request.
+        params = {"page": str(total_pages)}
+        if q:
+            params["q"] = q
+        return RedirectResponse(url=f"/keywords{query_string(params)}", status_code=303)
 
     resp = templates.TemplateResponse(
         "keywords.html",
-        {
-            "request": request,
+        base_context(request, lang) | {
             "nav_active": "keywords",
-            "lang": lang,
-            "lang_urls": build_lang_urls(request),
-            "t": t,
             "q": q,
             "error": error,
             "total": total,
@@ -63,14 +52,9 @@ async def keywords_page(request: Request) -> HTMLResponse:
     return resp
 
 
-@router.post("/keywords/add")
+@router.post("/keywords/add", dependencies=[Depends(require_auth)])
 async def keywords_add(request: Request) -> RedirectResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/keywords", status_code=303)
-
-    form = await request.form()
+    form = await form_fields(request)
     word = (form.get("keyword") or "").strip()
     lang = (form.get("lang") or "").strip()
     q = (form.get("q") or "").strip()
@@ -83,27 +67,27 @@ async def keywords_add(request: Request) -> RedirectResponse:
     if lang:
         params["lang"] = lang
     if not word:
-        params["error"] = t("keywords.error_empty", lang)
-        query = f"?{urlencode(params)}"
+        params["error"] = make_t(lang)("keywords.error_empty")
         return RedirectResponse(
-            url=f"/keywords{query}",
+            url=f"/keywords{query_string(params)}",
             status_code=303,
         )
-    query = f"?{urlencode(params)}" if params else ""
+    query = query_string(params)
 
     repo = request.app.state.repo
-    await repo.keyword_create(word)
+    # A pasted multi-line value becomes a bulk import: one COPY round trip
+    # instead of an INSERT per line.
+    words = [w for w in (line.strip() for line in word.splitlines()) if w]
+    if len(words) > 1:
+        await repo.keyword_bulk_create(words)
+    else:
+        await repo.keyword_create(words[0])
     return RedirectResponse(url=f"/keywords{query}", status_code=303)
 
 
-@router.post("/keywords/delete")
+@router.post("/keywords/delete", dependencies=[Depends(require_auth)])
 async def keywords_delete(request: Request) -> RedirectResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        return RedirectResponse(url="/login?next=/keywords", status_code=303)
-
-    form = await request.form()
+    form = await form_fields(request)
     word = (form.get("keyword") or "").strip()
     lang = (form.get("lang") or "").strip()
     q = (form.get("q") or "").strip()
@@ -115,7 +99,7 @@ async def keywords_delete(request: Request) -> RedirectResponse:
         params["page"] = page
     if lang:
         params["lang"] = lang
-    query = f"?{urlencode(params)}" if params else ""
+    query = query_string(params)
     if word:
         repo = request.app.state.repo
         await repo.keyword_delete(word)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 
-from app.web.deps import RedirectToLogin, require_auth
-from app.web.i18n import apply_lang_cookie, build_lang_urls, resolve_lang, t
+from app.web.deps import require_auth
+from app.web.i18n import apply_lang_cookie, base_context, resolve_lang
+from app.web.templating import templates
 
 
 router = APIRouter()
@@ -18,15 +19,12 @@ def _short_message(value: str, limit: int = 220) -> str:
     return value[:limit].rstrip() + "..."
 
 
-@router.get("/logs", response_class=HTMLResponse)
-async def logs_page(request: Request) -> HTMLResponse:
-    try:
-        require_auth(request)
-    except RedirectToLogin:
-        from app.web.deps import login_redirect
+# Applied in the template, so rows go to Jinja as-is (no per-row dict).
+templates.env.filters["short_msg"] = _short_message
 
-        return login_redirect(next_path="/logs")
 
+@router.get("/logs", response_class=HTMLResponse, dependencies=[Depends(require_auth)])
+async def logs_page(request: Request) -> HTMLResponse:
     lang, set_cookie = resolve_lang(request)
     repo = request.app.state.repo
     try:
@@ -36,32 +34,20 @@ async def logs_page(request: Request) -> HTMLResponse:
     page = max(page, 1)
     limit = 20
     offset = (page - 1) * limit
-    rows, total = await repo.event_error_list(limit=limit, offset=offset)
-    total_pages = max(1, (total + limit - 1) // limit)
-    if page > total_pages:
-        page = total_pages
-        offset = (page - 1) * limit
+    # One connection for the page fetch plus the possible clamp re-fetch.
+    async with repo.connection():
         rows, total = await repo.event_error_list(limit=limit, offset=offset)
-    logs = [
-        {
-            "id": r["id"],
-            "created_at": r["created_at"],
-            "message": _short_message(r["message"] or ""),
-        }
-        for r in rows
-    ]
-
-    from app.main import templates  # noqa: WPS433
+        total_pages = max(1, (total + limit - 1) // limit)
+        if page > total_pages:
+            page = total_pages
+            offset = (page - 1) * limit
+            rows, total = await repo.event_error_list(limit=limit, offset=offset)
 
     resp = templates.TemplateResponse(
         "logs.html",
-        {
-            "request": request,
+        base_context(request, lang) | {
             "nav_active": "logs",
-            "lang": lang,
-            "lang_urls": build_lang_urls(request),
-            "t": t,
-            "logs": logs,
+            "logs": rows,
             "page": page,
             "total_pages": total_pages,
             "offset": offset,
@@ -0,0 +1,36 @@
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+# Fixed directory (not the per-user tempdir default) so the cache written by
+# the Dockerfile prewarm step is the one every worker reads at runtime.
+_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR", "/tmp/jinja_cache")
+os.makedirs(_BYTECODE_CACHE_DIR, exist_ok=True)
+
+# Templates are immutable in the image: no auto-reload stat() per render, no
+# eviction of compiled templates, and compiled bytecode survives process
+# restarts via the filesystem cache.
+# Living in a leaf module (instead of app.main) lets route modules import
+# `templates` at the top without a circular import.
+env = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(directory=_BYTECODE_CACHE_DIR),
+)
+
+
+def precompile_all() -> None:
+    """Compiles every template (filling the bytecode cache). Called from the
+    Dockerfile so workers start with compilation already done, and from app
+    startup so no request ever pays for a first render."""
+    for name in env.list_templates(extensions=["html"]):
+        env.get_template(name)
+
+
+templates = Jinja2Templates(env=env)
+templates.env.globals["app_name"] = os.getenv("APP_NAME", "tg-keyword-watcher")